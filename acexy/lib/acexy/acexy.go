@@ -5,6 +5,7 @@
 package acexy
 
 import (
+	"context"
 	"encoding/json"
 	"errors"
 	"io"
@@ -64,6 +65,7 @@ type Acexy struct {
 	NoResponseTimeout time.Duration // Timeout to wait for a response from the AceStream middleware
 
 	middleware *http.Client
+	api        *http.Client
 }
 
 type AcexyEndpoint string
@@ -88,6 +90,14 @@ func (a *Acexy) Init() {
 			ExpectContinueTimeout: 1 * time.Second,
 		},
 	}
+	// Short-lived API calls get their own connection pool, so long-lived playback connections
+	// counting against MaxConnsPerHost above cannot leave them waiting for a free slot
+	apiTransport := http.DefaultTransport.(*http.Transport).Clone()
+	apiTransport.MaxIdleConnsPerHost = 50
+	a.api = &http.Client{
+		Transport: apiTransport,
+		Timeout:   a.NoResponseTimeout,
+	}
 }
 
 // FetchStream requests stream information from AceStream engine.
@@ -181,11 +191,9 @@ func GetStream(a *Acexy, aceId AceID, extraParams url.Values) (*AceStreamMiddlew
 	req.Header.Set("Content-Type", "application/json")
 	req.URL.RawQuery = extraParams.Encode()
 
-	slog.Debug("Request URL", "url", req.URL.String())
-	client := &http.Client{
-		Timeout: a.NoResponseTimeout,
-	}
-	res, err := client.Do(req)
+	// Pass the URL itself so it is only formatted when debug logging is enabled
+	slog.Debug("Request URL", "url", req.URL)
+	res, err := a.api.Do(req)
 	if err != nil {
 		slog.Debug("Error getting stream", "error", err)
 		return nil, err
@@ -199,7 +207,10 @@ func GetStream(a *Acexy, aceId AceID, extraParams url.Values) (*AceStreamMiddlew
 		return nil, err
 	}
 
-	slog.Debug("Stream response", "response", string(body))
+	// Avoid copying the response body into a string unless it is going to be logged
+	if slog.Default().Enabled(context.Background(), slog.LevelDebug) {
+		slog.Debug("Stream response", "response", string(body))
+	}
 	var response AceStreamMiddleware
 	if err := json.Unmarshal(body, &response); err != nil {
 		slog.Debug("Error unmarshalling stream response", "error", err)
@@ -213,6 +224,11 @@ func GetStream(a *Acexy, aceId AceID, extraParams url.Values) (*AceStreamMiddlew
 	return &response, nil
 }
 
+// Shared client for the engine command API, so stop commands reuse pooled connections
+var commandClient = &http.Client{
+	Timeout: 10 * time.Second,
+}
+
 // CloseStream closes a stream by sending a stop command to the AceStream backend.
 func CloseStream(stream *AceStream) error {
 	req, err := http.NewRequest("GET", stream.CommandURL, nil)
@@ -224,10 +240,7 @@ func CloseStream(stream *AceStream) error {
 	q.Add("method", "stop")
 	req.URL.RawQuery = q.Encode()
 
-	client := &http.Client{
-		Timeout: 10 * time.Second,
-	}
-	res, err := client.Do(req)
+	res, err := commandClient.Do(req)
 	if err != nil {
 		return err
 	}
@@ -5,6 +5,7 @@ import (
 	"errors"
 	"io"
 	"log/slog"
+	"sync"
 	"sync/atomic"
 	"time"
 )
@@ -12,6 +13,24 @@ import (
 // ErrEmptyTimeout is returned when the copier times out waiting for data
 var ErrEmptyTimeout = errors.New("stream empty timeout: no data received within timeout period")
 
+// Buffered writers are recycled across streams so each new stream does not allocate
+// (and zero) a fresh multi-megabyte buffer.
+var writerPool sync.Pool
+
+func getBufferedWriter(w io.Writer, size int) *bufio.Writer {
+	if bw, ok := writerPool.Get().(*bufio.Writer); ok && bw.Size() == size {
+		bw.Reset(w)
+		return bw
+	}
+	return bufio.NewWriterSize(w, size)
+}
+
+func putBufferedWriter(bw *bufio.Writer) {
+	// Drop the reference to the destination so it can be collected
+	bw.Reset(nil)
+	writerPool.Put(bw)
+}
+
 // Copier is an implementation that copies the data from the source to the destination.
 // It has an empty timeout that is used to determine when the source is empty - this is,
 // it has no more data to read after the timeout.
@@ -34,7 +53,7 @@ type Copier struct {
 
 // Starts copying the data from the source to the destination.
 func (c *Copier) Copy() error {
-	c.bufferedWriter = bufio.NewWriterSize(c.Destination, c.BufferSize)
+	c.bufferedWriter = getBufferedWriter(c.Destination, c.BufferSize)
 	c.timer = time.NewTimer(c.EmptyTimeout)
 	done := make(chan struct{})
 	defer close(done)
@@ -77,6 +96,10 @@ func (c *Copier) Copy() error {
 			err = ferr
 		}
 	}
+
+	// The buffer is no longer needed once flushed, so hand it back for the next stream
+	putBufferedWriter(c.bufferedWriter)
+	c.bufferedWriter = nil
 	
 	// If the timeout occurred, return ErrEmptyTimeout instead of the underlying error
 	if c.timedOut.Load() {
@@ -110,3 +110,26 @@ func TestCopier_BytesCopied(t *testing.T) {
 		t.Errorf("Expected %d bytes copied, got %d", expected, copier.BytesCopied())
 	}
 }
+
+func TestCopier_ReleasesBufferedWriter(t *testing.T) {
+	for _, payload := range []string{"first stream", "second"} {
+		var buf bytes.Buffer
+		copier := &Copier{
+			Destination:  &buf,
+			Source:       bytes.NewReader([]byte(payload)),
+			EmptyTimeout: 1 * time.Second,
+			BufferSize:   1024,
+		}
+
+		if err := copier.Copy(); err != nil && err != io.EOF {
+			t.Fatalf("Unexpected error: %v", err)
+		}
+		if buf.String() != payload {
+			t.Errorf("Expected %q, got %q", payload, buf.String())
+		}
+		// The writer goes back to the pool once the copy finishes
+		if copier.bufferedWriter != nil {
+			t.Error("Expected buffered writer to be released after Copy")
+		}
+	}
+}
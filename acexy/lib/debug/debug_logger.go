@@ -20,6 +20,14 @@ type DebugLogger struct {
 	sessionID    string
 	sessionStart time.Time
 	mu           sync.Mutex
+	files        map[string]*logFile // Open log files, one per category
+	closed       bool
+}
+
+// logFile is an open category log file along with the identity of the file it was opened as
+type logFile struct {
+	file *os.File
+	info os.FileInfo
 }
 
 // LogEntry represents a single log entry with metadata
@@ -31,12 +39,14 @@ type LogEntry struct {
 
 // NewDebugLogger creates a new debug logger instance
 func NewDebugLogger(enabled bool, logDir string) *DebugLogger {
-	sessionID := time.Now().Format("20060102_150405")
+	now := time.Now()
+	sessionID := now.Format("20060102_150405")
 	logger := &DebugLogger{
 		enabled:      enabled,
 		logDir:       logDir,
-		sessionStart: time.Now(),
+		sessionStart: now,
 		sessionID:    sessionID,
+		files:        make(map[string]*logFile),
 	}
 
 	if enabled {
@@ -56,14 +66,14 @@ func (d *DebugLogger) writeLog(category string, data map[string]interface{}) {
 		return
 	}
 
-	d.mu.Lock()
-	defer d.mu.Unlock()
+	// Read the clock once so timestamp and elapsed time describe the same instant
+	now := time.Now()
 
 	// Create a combined map with metadata and data
 	entry := map[string]interface{}{
 		"session_id":      d.sessionID,
-		"timestamp":       time.Now().UTC().Format(time.RFC3339Nano),
-		"elapsed_seconds": time.Since(d.sessionStart).Seconds(),
+		"timestamp":       now.UTC().Format(time.RFC3339Nano),
+		"elapsed_seconds": now.Sub(d.sessionStart).Seconds(),
 	}
 
 	// Add all data fields to the entry
@@ -71,14 +81,70 @@ func (d *DebugLogger) writeLog(category string, data map[string]interface{}) {
 		entry[k] = v
 	}
 
+	// Encode before taking the lock so concurrent callers only serialize on the write itself
+	line, err := json.Marshal(entry)
+	if err != nil {
+		return
+	}
+	line = append(line, '\n')
+
+	d.mu.Lock()
+	defer d.mu.Unlock()
+
+	if d.closed {
+		return
+	}
+
+	file, err := d.file(category)
+	if err != nil {
+		return
+	}
+
+	file.Write(line)
+}
+
+// file returns the open log file for the given category, opening it on first use.
+// The file is reopened if the path no longer refers to it (e.g. after log rotation).
+// Must be called with d.mu held.
+func (d *DebugLogger) file(category string) (*os.File, error) {
 	filename := filepath.Join(d.logDir, fmt.Sprintf("%s_%s.jsonl", d.sessionID, category))
+
+	if lf, ok := d.files[category]; ok {
+		if info, err := os.Stat(filename); err == nil && os.SameFile(info, lf.info) {
+			return lf.file, nil
+		}
+		// The file was renamed or removed, stop writing to the old one
+		lf.file.Close()
+		delete(d.files, category)
+	}
+
 	file, err := os.OpenFile(filename, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0644)
 	if err != nil {
-		return
+		return nil, err
 	}
-	defer file.Close()
+	info, err := file.Stat()
+	if err != nil {
+		file.Close()
+		return nil, err
+	}
+	d.files[category] = &logFile{file: file, info: info}
+	return file, nil
+}
+
+// Close closes all the log files opened by the logger. Any later writes are discarded
+func (d *DebugLogger) Close() error {
+	d.mu.Lock()
+	defer d.mu.Unlock()
 
-	json.NewEncoder(file).Encode(entry)
+	d.closed = true
+	var firstErr error
+	for category, lf := range d.files {
+		if err := lf.file.Close(); err != nil && firstErr == nil {
+			firstErr = err
+		}
+		delete(d.files, category)
+	}
+	return firstErr
 }
 
 // LogRequest logs HTTP request timing and outcomes
@@ -191,6 +257,9 @@ var globalLogger *DebugLogger
 
 // InitDebugLogger initializes the global debug logger
 func InitDebugLogger(enabled bool, logDir string) {
+	if globalLogger != nil {
+		globalLogger.Close()
+	}
 	globalLogger = NewDebugLogger(enabled, logDir)
 }
 
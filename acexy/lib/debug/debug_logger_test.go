@@ -444,6 +444,62 @@ func TestDebugLogger_Disconnect(t *testing.T) {
 	}
 }
 
+func TestDebugLogger_ReopensRotatedFile(t *testing.T) {
+	tempDir := t.TempDir()
+	logger := NewDebugLogger(true, tempDir)
+	defer logger.Close()
+
+	logger.LogRequest("GET", "/ace/getstream", 10*time.Millisecond, 200, "before_rotation")
+
+	files, _ := filepath.Glob(filepath.Join(tempDir, "*_requests.jsonl"))
+	if len(files) != 1 {
+		t.Fatalf("Expected 1 request log file, got %d", len(files))
+	}
+
+	// Rotate the file the way logrotate does with "create"
+	rotated := files[0] + ".1"
+	if err := os.Rename(files[0], rotated); err != nil {
+		t.Fatalf("Failed to rotate log file: %v", err)
+	}
+	if err := os.WriteFile(files[0], nil, 0644); err != nil {
+		t.Fatalf("Failed to create new log file: %v", err)
+	}
+
+	logger.LogRequest("GET", "/ace/getstream", 10*time.Millisecond, 200, "after_rotation")
+
+	data, err := os.ReadFile(rotated)
+	if err != nil {
+		t.Fatalf("Failed to read rotated log file: %v", err)
+	}
+	if lines := parseJSONLines(t, data); len(lines) != 1 || lines[0]["ace_id"] != "before_rotation" {
+		t.Errorf("Expected only the pre-rotation entry in the rotated file, got %v", lines)
+	}
+
+	data, err = os.ReadFile(files[0])
+	if err != nil {
+		t.Fatalf("Failed to read new log file: %v", err)
+	}
+	if lines := parseJSONLines(t, data); len(lines) != 1 || lines[0]["ace_id"] != "after_rotation" {
+		t.Errorf("Expected the post-rotation entry in the new file, got %v", lines)
+	}
+}
+
+func TestDebugLogger_DiscardsWritesAfterClose(t *testing.T) {
+	tempDir := t.TempDir()
+	logger := NewDebugLogger(true, tempDir)
+
+	if err := logger.Close(); err != nil {
+		t.Errorf("Close returned error: %v", err)
+	}
+
+	logger.LogRequest("GET", "/ace/getstream", 10*time.Millisecond, 200, "after_close")
+
+	files, _ := filepath.Glob(filepath.Join(tempDir, "*_requests.jsonl"))
+	if len(files) != 0 {
+		t.Errorf("Expected no request log file after Close, got %d", len(files))
+	}
+}
+
 // Helper function to parse JSONL file
 func parseJSONLines(t *testing.T, data []byte) []map[string]interface{} {
 	t.Helper()
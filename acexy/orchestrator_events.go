@@ -108,13 +108,23 @@ func newOrchClient(base string) *orchClient {
 	if base == "" {
 		return nil
 	}
+	// All requests go to the same orchestrator host, so keep enough idle
+	// connections around to avoid re-dialing under concurrent stream starts
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConns = 100
+	transport.MaxIdleConnsPerHost = 50
+	transport.IdleConnTimeout = 90 * time.Second
+
 	ctx, cancel := context.WithCancel(context.Background())
 	client := &orchClient{
 		base:                base,
 		key:                 os.Getenv("ACEXY_ORCH_APIKEY"),
 		containerID:         os.Getenv("ACEXY_CONTAINER_ID"),
 		maxStreamsPerEngine: 1, // Default value, will be set from main
-		hc:                  &http.Client{Timeout: 3 * time.Second},
+		hc: &http.Client{
+			Timeout:   3 * time.Second,
+			Transport: transport,
+		},
 		ctx:                 ctx,
 		cancel:              cancel,
 		endedStreams:        make(map[string]bool),
@@ -595,6 +605,23 @@ func (c *orchClient) GetEngines() ([]engineState, error) {
 	c.engineCacheMu.RUnlock()
 
 	// Cache miss or expired, fetch fresh data
+	engines, err := c.fetchEngines()
+	if err != nil {
+		return nil, err
+	}
+
+	// Update cache with write lock
+	c.engineCacheMu.Lock()
+	c.engineCache = engines
+	c.engineCacheTime = time.Now()
+	c.engineCacheMu.Unlock()
+
+	slog.Debug("Fetched and cached engine list", "count", len(engines))
+	return engines, nil
+}
+
+// fetchEngines queries the orchestrator for the current engine list, bypassing the cache
+func (c *orchClient) fetchEngines() ([]engineState, error) {
 	req, err := http.NewRequest(http.MethodGet, c.base+"/engines", nil)
 	if err != nil {
 		return nil, fmt.Errorf("failed to create request: %w", err)
@@ -618,24 +645,47 @@ func (c *orchClient) GetEngines() ([]engineState, error) {
 	if err := json.NewDecoder(resp.Body).Decode(&engines); err != nil {
 		return nil, fmt.Errorf("failed to decode engines response: %w", err)
 	}
+	return engines, nil
+}
 
-	// Update cache with write lock
-	c.engineCacheMu.Lock()
-	c.engineCache = engines
-	c.engineCacheTime = time.Now()
-	c.engineCacheMu.Unlock()
+// waitForEngine polls the orchestrator until the given container is listed as healthy
+// or the timeout elapses. The orchestrator lists new engines as soon as they are
+// provisioned, so being listed alone does not mean the engine's API is up yet.
+// Returns true if the engine became healthy
+func (c *orchClient) waitForEngine(containerID string, timeout time.Duration) bool {
+	deadline := time.Now().Add(timeout)
+	for {
+		// Bypass the cache, a freshly provisioned engine would not be in it
+		engines, err := c.fetchEngines()
+		if err == nil {
+			for _, eng := range engines {
+				if eng.ContainerID == containerID && eng.HealthStatus == "healthy" {
+					return true
+				}
+			}
+		} else {
+			slog.Debug("Failed to poll engines while waiting for provisioned engine", "error", err)
+		}
 
-	slog.Debug("Fetched and cached engine list", "count", len(engines))
-	return engines, nil
+		if time.Now().Add(500 * time.Millisecond).After(deadline) {
+			return false
+		}
+		select {
+		case <-c.ctx.Done():
+			return false
+		case <-time.After(500 * time.Millisecond):
+		}
+	}
 }
 
-// GetEngineStreams retrieves streams for a specific engine
-func (c *orchClient) GetEngineStreams(containerID string) ([]streamState, error) {
+// GetActiveStreamCounts retrieves all started streams in a single request and
+// returns the number of active streams per engine container ID
+func (c *orchClient) GetActiveStreamCounts() (map[string]int, error) {
 	if c == nil {
 		return nil, fmt.Errorf("orchestrator client not configured")
 	}
 
-	req, err := http.NewRequest(http.MethodGet, c.base+"/streams?container_id="+containerID+"&status=started", nil)
+	req, err := http.NewRequest(http.MethodGet, c.base+"/streams?status=started", nil)
 	if err != nil {
 		return nil, fmt.Errorf("failed to create request: %w", err)
 	}
@@ -659,7 +709,14 @@ func (c *orchClient) GetEngineStreams(containerID string) ([]streamState, error)
 		return nil, fmt.Errorf("failed to decode streams response: %w", err)
 	}
 
-	return streams, nil
+	counts := make(map[string]int)
+	for _, stream := range streams {
+		if stream.Status == "started" {
+			counts[stream.ContainerID]++
+		}
+	}
+
+	return counts, nil
 }
 
 // calculateWaitTime determines how long to wait before retrying based on recovery ETA
@@ -817,6 +874,33 @@ func (c *orchClient) ProvisionAcestream() (*aceProvisionResponse, error) {
 	}
 }
 
+// engineWithLoad pairs an engine with its number of active streams for prioritization
+type engineWithLoad struct {
+	engine        engineState
+	activeStreams int
+}
+
+// isPreferredEngine reports whether engine a should be chosen over engine b.
+// Engines are ranked by health status first (healthy engines prioritized),
+// then by stream count (empty engines prioritized - addressing issue where all streams go to forwarded engines),
+// then by forwarded status (forwarded engines prioritized as they are faster),
+// then by last_stream_usage (ascending - oldest first)
+func isPreferredEngine(a, b engineWithLoad) bool {
+	aHealthy := a.engine.HealthStatus == "healthy"
+	bHealthy := b.engine.HealthStatus == "healthy"
+	if aHealthy != bHealthy {
+		return aHealthy
+	}
+	if a.activeStreams != b.activeStreams {
+		return a.activeStreams < b.activeStreams
+	}
+	if a.engine.Forwarded != b.engine.Forwarded {
+		return a.engine.Forwarded
+	}
+	// Among engines with same health, stream count, and forwarded status, pick the one unused the longest
+	return a.engine.LastStreamUsage.Before(b.engine.LastStreamUsage)
+}
+
 // SelectBestEngine selects the best available engine based on load balancing rules
 // Returns host, port, containerID, and error. Prioritizes healthy engines first, then forwarded engines (faster),
 // then among engines with the same health status, forwarded status, and stream count, chooses the one with the
@@ -839,42 +923,53 @@ func (c *orchClient) SelectBestEngine() (string, int, string, error) {
 
 	slog.Debug("Found engines from orchestrator", "count", len(engines), "max_streams_per_engine", c.maxStreamsPerEngine)
 
-	// Collect engines with their stream counts for prioritization
-	type engineWithLoad struct {
-		engine        engineState
-		activeStreams int
+	// Only the best engine is needed, so track it in a single pass instead of sorting all candidates
+	var bestEngine engineWithLoad
+	availableCount := 0
+
+	// Fetch the active stream counts for all engines in one request instead of one per engine
+	var streamCounts map[string]int
+	if len(engines) > 0 {
+		streamCounts, err = c.GetActiveStreamCounts()
+		if err != nil {
+			// A single failed query would otherwise leave every engine's load unknown, so retry it once
+			slog.Warn("Failed to get active streams, retrying", "error", err)
+			streamCounts, err = c.GetActiveStreamCounts()
+		}
+		if err != nil {
+			// Never provision on an unknown load, let the caller fall back as when the engines query fails
+			duration := time.Since(startTime)
+			debugLog.LogEngineSelection("select_best_engine", "", 0, "", duration, err.Error())
+			return "", 0, "", fmt.Errorf("failed to get streams: %w", err)
+		}
 	}
 
-	var availableEngines []engineWithLoad
+	// Only format timestamps for the per-engine log line when it is actually going to be written
+	debugEnabled := slog.Default().Enabled(context.Background(), slog.LevelDebug)
 
 	// Check stream count for each engine
 	for _, engine := range engines {
-		streams, err := c.GetEngineStreams(engine.ContainerID)
-		if err != nil {
-			slog.Warn("Failed to get streams for engine", "container_id", engine.ContainerID, "error", err)
-			continue
-		}
+		activeStreams := streamCounts[engine.ContainerID]
 
-		activeStreams := 0
-		for _, stream := range streams {
-			if stream.Status == "started" {
-				activeStreams++
-			}
+		if debugEnabled {
+			slog.Debug("Engine stream count", "container_id", engine.ContainerID, "active_streams", activeStreams, "host", engine.Host, "port", engine.Port, "forwarded", engine.Forwarded, "max_allowed", c.maxStreamsPerEngine, "health_status", engine.HealthStatus, "last_health_check", engine.LastHealthCheck.Format(time.RFC3339), "last_stream_usage", engine.LastStreamUsage.Format(time.RFC3339))
 		}
 
-		slog.Debug("Engine stream count", "container_id", engine.ContainerID, "active_streams", activeStreams, "host", engine.Host, "port", engine.Port, "forwarded", engine.Forwarded, "max_allowed", c.maxStreamsPerEngine, "health_status", engine.HealthStatus, "last_health_check", engine.LastHealthCheck.Format(time.RFC3339), "last_stream_usage", engine.LastStreamUsage.Format(time.RFC3339))
-
 		// Only consider engines that have capacity
 		if activeStreams < c.maxStreamsPerEngine {
-			availableEngines = append(availableEngines, engineWithLoad{
+			candidate := engineWithLoad{
 				engine:        engine,
 				activeStreams: activeStreams,
-			})
+			}
+			if availableCount == 0 || isPreferredEngine(candidate, bestEngine) {
+				bestEngine = candidate
+			}
+			availableCount++
 		}
 	}
 
 	// If no engines have capacity, provision a new one
-	if len(availableEngines) == 0 {
+	if availableCount == 0 {
 		// Check if we can provision before attempting
 		canProvision, shouldWait, recoveryETA := c.GetProvisioningStatus()
 
@@ -903,25 +998,16 @@ func (c *orchClient) SelectBestEngine() (string, int, string, error) {
 			return "", 0, "", err
 		}
 
-		// Shorter wait since orchestrator now syncs state immediately
-		time.Sleep(5 * time.Second)
-
-		// Verify engine appears in list
-		engines, err := c.GetEngines()
-		if err == nil {
-			for _, eng := range engines {
-				if eng.ContainerID == provResp.ContainerID {
-					slog.Info("Provisioned engine found in orchestrator",
-						"container_id", provResp.ContainerID,
-						"container_name", provResp.ContainerName)
-					return "localhost", provResp.HostHTTPPort, provResp.ContainerID, nil
-				}
-			}
+		// Poll until the orchestrator reports the new engine as healthy instead of waiting a fixed time
+		if c.waitForEngine(provResp.ContainerID, 10*time.Second) {
+			slog.Info("Provisioned engine is healthy",
+				"container_id", provResp.ContainerID,
+				"container_name", provResp.ContainerName)
+			return "localhost", provResp.HostHTTPPort, provResp.ContainerID, nil
 		}
 
-		// Still not found, wait a bit more and return anyway
-		slog.Warn("Engine not immediately available, continuing anyway")
-		time.Sleep(5 * time.Second)
+		// Still not healthy, return anyway
+		slog.Warn("Engine not healthy after waiting, continuing anyway")
 
 		slog.Info("Provisioned new engine", "container_id", provResp.ContainerID, "container_name", provResp.ContainerName, "host_port", provResp.HostHTTPPort, "container_port", provResp.ContainerHTTPPort)
 
@@ -929,52 +1015,7 @@ func (c *orchClient) SelectBestEngine() (string, int, string, error) {
 		return "localhost", provResp.HostHTTPPort, provResp.ContainerID, nil
 	}
 
-	// Sort engines by health status first (healthy engines prioritized),
-	// then by stream count (empty engines prioritized - addressing issue where all streams go to forwarded engines),
-	// then by forwarded status (forwarded engines prioritized as they are faster),
-	// then by last_stream_usage (ascending - oldest first)
-	for i := 0; i < len(availableEngines); i++ {
-		for j := i + 1; j < len(availableEngines); j++ {
-			iEngine := availableEngines[i]
-			jEngine := availableEngines[j]
-
-			// Primary sort: by health status (healthy engines first)
-			iHealthy := iEngine.engine.HealthStatus == "healthy"
-			jHealthy := jEngine.engine.HealthStatus == "healthy"
-
-			if iHealthy != jHealthy {
-				// If one is healthy and other is not, prioritize healthy
-				if jHealthy && !iHealthy {
-					availableEngines[i], availableEngines[j] = availableEngines[j], availableEngines[i]
-				}
-			} else {
-				// Both have same health status, sort by active stream count (empty engines prioritized)
-				if iEngine.activeStreams > jEngine.activeStreams {
-					availableEngines[i], availableEngines[j] = availableEngines[j], availableEngines[i]
-				} else if iEngine.activeStreams == jEngine.activeStreams {
-					// Same health and stream count, sort by forwarded status (forwarded engines prioritized)
-					iForwarded := iEngine.engine.Forwarded
-					jForwarded := jEngine.engine.Forwarded
-
-					if iForwarded != jForwarded {
-						// If one is forwarded and other is not, prioritize forwarded
-						if jForwarded && !iForwarded {
-							availableEngines[i], availableEngines[j] = availableEngines[j], availableEngines[i]
-						}
-					} else {
-						// Same health, stream count, and forwarded status, sort by last_stream_usage (ascending - oldest first)
-						// This ensures that among engines with same health, stream count, and forwarded status, we pick the one unused the longest
-						if iEngine.engine.LastStreamUsage.After(jEngine.engine.LastStreamUsage) {
-							availableEngines[i], availableEngines[j] = availableEngines[j], availableEngines[i]
-						}
-					}
-				}
-			}
-		}
-	}
-
-	// Select the engine with the least active streams (empty engines are prioritized)
-	bestEngine := availableEngines[0]
+	// Use the engine with the least active streams (empty engines are prioritized)
 	host := bestEngine.engine.Host
 	port := bestEngine.engine.Port
 	containerID := bestEngine.engine.ContainerID
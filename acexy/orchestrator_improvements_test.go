@@ -296,3 +296,200 @@ func TestEmitEndedWithEmptyStreamID(t *testing.T) {
 
 	t.Log("Empty streamID handled gracefully")
 }
+
+// TestSelectBestEngineSingleStreamsQuery verifies that engine selection fetches
+// stream counts with one request regardless of the number of engines
+func TestSelectBestEngineSingleStreamsQuery(t *testing.T) {
+	streamsQueries := 0
+	var queryMu sync.Mutex
+
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Header().Set("Content-Type", "application/json")
+		switch r.URL.Path {
+		case "/engines":
+			json.NewEncoder(w).Encode([]engineState{
+				{ContainerID: "busy-engine", Host: "localhost", Port: 19001, HealthStatus: "healthy"},
+				{ContainerID: "idle-engine", Host: "localhost", Port: 19002, HealthStatus: "healthy"},
+				{ContainerID: "other-engine", Host: "localhost", Port: 19003, HealthStatus: "healthy"},
+			})
+		case "/streams":
+			queryMu.Lock()
+			streamsQueries++
+			queryMu.Unlock()
+			if r.URL.Query().Get("container_id") != "" {
+				t.Errorf("Expected a single unfiltered streams query, got container_id=%s", r.URL.Query().Get("container_id"))
+			}
+			json.NewEncoder(w).Encode([]streamState{
+				{ID: "s1", ContainerID: "busy-engine", Status: "started"},
+				{ID: "s2", ContainerID: "other-engine", Status: "started"},
+			})
+		default:
+			t.Errorf("Unexpected request to %s", r.URL.Path)
+		}
+	}))
+	defer server.Close()
+
+	ctx, cancel := context.WithCancel(context.Background())
+	defer cancel()
+
+	client := &orchClient{
+		base:                server.URL,
+		maxStreamsPerEngine: 1,
+		hc:                  &http.Client{Timeout: 3 * time.Second},
+		ctx:                 ctx,
+		cancel:              cancel,
+		endedStreams:        make(map[string]bool),
+		engineCacheDuration: 2 * time.Second,
+	}
+
+	host, port, containerID, err := client.SelectBestEngine()
+	if err != nil {
+		t.Fatalf("SelectBestEngine failed: %v", err)
+	}
+	if containerID != "idle-engine" || host != "localhost" || port != 19002 {
+		t.Errorf("Expected idle-engine on localhost:19002, got %s on %s:%d", containerID, host, port)
+	}
+
+	queryMu.Lock()
+	defer queryMu.Unlock()
+	if streamsQueries != 1 {
+		t.Errorf("Expected exactly 1 streams query for 3 engines, got %d", streamsQueries)
+	}
+}
+
+// TestSelectBestEngineStreamsQueryFailure verifies that a failed streams query is retried
+// once, and that selection fails instead of provisioning when the load stays unknown
+func TestSelectBestEngineStreamsQueryFailure(t *testing.T) {
+	tests := []struct {
+		name          string
+		failures      int
+		expectErr     bool
+		expectQueries int
+	}{
+		{name: "transient failure is retried", failures: 1, expectErr: false, expectQueries: 2},
+		{name: "persistent failure aborts selection", failures: 2, expectErr: true, expectQueries: 2},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			streamsQueries := 0
+			var queryMu sync.Mutex
+
+			server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+				w.Header().Set("Content-Type", "application/json")
+				switch r.URL.Path {
+				case "/engines":
+					json.NewEncoder(w).Encode([]engineState{
+						{ContainerID: "existing-engine", Host: "localhost", Port: 19001, HealthStatus: "healthy"},
+					})
+				case "/streams":
+					queryMu.Lock()
+					streamsQueries++
+					fail := streamsQueries <= tt.failures
+					queryMu.Unlock()
+					if fail {
+						w.WriteHeader(http.StatusInternalServerError)
+						return
+					}
+					json.NewEncoder(w).Encode([]streamState{})
+				case "/provision/acestream":
+					t.Error("Expected no provisioning while engine load is unknown")
+					w.WriteHeader(http.StatusInternalServerError)
+				default:
+					t.Errorf("Unexpected request to %s", r.URL.Path)
+				}
+			}))
+			defer server.Close()
+
+			ctx, cancel := context.WithCancel(context.Background())
+			defer cancel()
+
+			client := &orchClient{
+				base:                server.URL,
+				maxStreamsPerEngine: 1,
+				hc:                  &http.Client{Timeout: 3 * time.Second},
+				ctx:                 ctx,
+				cancel:              cancel,
+				endedStreams:        make(map[string]bool),
+				engineCacheDuration: 2 * time.Second,
+			}
+			client.health.canProvision = true
+
+			host, port, containerID, err := client.SelectBestEngine()
+			if tt.expectErr {
+				if err == nil {
+					t.Fatalf("Expected an error, got %s on %s:%d", containerID, host, port)
+				}
+			} else {
+				if err != nil {
+					t.Fatalf("Expected selection to succeed after retry, got: %v", err)
+				}
+				if containerID != "existing-engine" || host != "localhost" || port != 19001 {
+					t.Errorf("Expected existing-engine on localhost:19001, got %s on %s:%d", containerID, host, port)
+				}
+			}
+
+			queryMu.Lock()
+			defer queryMu.Unlock()
+			if streamsQueries != tt.expectQueries {
+				t.Errorf("Expected %d streams queries, got %d", tt.expectQueries, streamsQueries)
+			}
+		})
+	}
+}
+
+// TestWaitForEngineReturnsWhenReady verifies that waiting for a provisioned engine
+// returns as soon as the orchestrator reports it healthy instead of sleeping a fixed time
+func TestWaitForEngineReturnsWhenReady(t *testing.T) {
+	polls := 0
+	var pollMu sync.Mutex
+
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.URL.Path != "/engines" {
+			t.Errorf("Unexpected request to %s", r.URL.Path)
+			return
+		}
+		pollMu.Lock()
+		polls++
+		current := polls
+		pollMu.Unlock()
+
+		// The engine is listed right away, but only becomes healthy on the third poll
+		engine := engineState{ContainerID: "new-engine", Host: "localhost", Port: 19000, HealthStatus: "unknown"}
+		if current >= 3 {
+			engine.HealthStatus = "healthy"
+		}
+		w.Header().Set("Content-Type", "application/json")
+		json.NewEncoder(w).Encode([]engineState{engine})
+	}))
+	defer server.Close()
+
+	ctx, cancel := context.WithCancel(context.Background())
+	defer cancel()
+
+	client := &orchClient{
+		base:                server.URL,
+		hc:                  &http.Client{Timeout: 3 * time.Second},
+		ctx:                 ctx,
+		cancel:              cancel,
+		engineCacheDuration: 2 * time.Second,
+	}
+
+	start := time.Now()
+	if !client.waitForEngine("new-engine", 10*time.Second) {
+		t.Fatal("Expected provisioned engine to become healthy")
+	}
+	if elapsed := time.Since(start); elapsed > 3*time.Second {
+		t.Errorf("Expected engine to be found quickly, took %v", elapsed)
+	}
+
+	pollMu.Lock()
+	if polls < 3 {
+		t.Errorf("Expected waiting to continue while the engine was listed but not healthy, got %d polls", polls)
+	}
+	pollMu.Unlock()
+
+	if client.waitForEngine("missing-engine", 1*time.Second) {
+		t.Error("Expected missing engine to time out")
+	}
+}
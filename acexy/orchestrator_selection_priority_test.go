@@ -1,6 +1,7 @@
 package main
 
 import (
+	"sort"
 	"testing"
 	"time"
 )
@@ -108,53 +109,12 @@ func TestEngineSelectionPriorityOrder(t *testing.T) {
 		},
 	}
 
-	// Apply the same sorting logic as in SelectBestEngine
+	// Order the engines with the same comparator SelectBestEngine uses to pick the best one
 	availableEngines := make([]engineWithLoad, len(engines))
 	copy(availableEngines, engines)
-
-	// Sort engines by health status first (healthy engines prioritized),
-	// then by stream count (empty engines prioritized - addressing issue where all streams go to forwarded engines),
-	// then by forwarded status (forwarded engines prioritized as they are faster),
-	// then by last_stream_usage (ascending - oldest first)
-	for i := 0; i < len(availableEngines); i++ {
-		for j := i + 1; j < len(availableEngines); j++ {
-			iEngine := availableEngines[i]
-			jEngine := availableEngines[j]
-
-			// Primary sort: by health status (healthy engines first)
-			iHealthy := iEngine.engine.HealthStatus == "healthy"
-			jHealthy := jEngine.engine.HealthStatus == "healthy"
-
-			if iHealthy != jHealthy {
-				// If one is healthy and other is not, prioritize healthy
-				if jHealthy && !iHealthy {
-					availableEngines[i], availableEngines[j] = availableEngines[j], availableEngines[i]
-				}
-			} else {
-				// Both have same health status, sort by active stream count (empty engines prioritized)
-				if iEngine.activeStreams > jEngine.activeStreams {
-					availableEngines[i], availableEngines[j] = availableEngines[j], availableEngines[i]
-				} else if iEngine.activeStreams == jEngine.activeStreams {
-					// Same health and stream count, sort by forwarded status (forwarded engines prioritized)
-					iForwarded := iEngine.engine.Forwarded
-					jForwarded := jEngine.engine.Forwarded
-
-					if iForwarded != jForwarded {
-						// If one is forwarded and other is not, prioritize forwarded
-						if jForwarded && !iForwarded {
-							availableEngines[i], availableEngines[j] = availableEngines[j], availableEngines[i]
-						}
-					} else {
-						// Same health, stream count, and forwarded status, sort by last_stream_usage (ascending - oldest first)
-						// This ensures that among engines with same health, stream count, and forwarded status, we pick the one unused the longest
-						if iEngine.engine.LastStreamUsage.After(jEngine.engine.LastStreamUsage) {
-							availableEngines[i], availableEngines[j] = availableEngines[j], availableEngines[i]
-						}
-					}
-				}
-			}
-		}
-	}
+	sort.SliceStable(availableEngines, func(i, j int) bool {
+		return isPreferredEngine(availableEngines[i], availableEngines[j])
+	})
 
 	// Verify the priority order matches the requirements
 	
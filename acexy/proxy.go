@@ -41,6 +41,9 @@ var (
 //go:embed LICENSE.short
 var LICENSE string
 
+// Pre-rendered body for the status endpoint, which never changes in stateless mode
+var statusOKResponse = []byte(`{"status":"ok"}` + "\n")
+
 // The API URL we are listening to
 const APIv1_URL = "/ace"
 
@@ -272,11 +275,14 @@ func (p *Proxy) HandleStream(w http.ResponseWriter, r *http.Request) {
 			"stream_id", streamID, "reason", reason)
 		p.Orch.EmitEnded(streamID, reason)
 		
-		// Send stop command to AceStream engine to clean up resources
-		if err := acexy.CloseStream(stream); err != nil {
-			slog.Debug("Failed to send stop command to engine", 
-				"stream_id", streamID, "error", err)
-		}
+		// Send stop command to AceStream engine to clean up resources. This runs in the
+		// background so the handler does not stay blocked on the engine's command API.
+		go func() {
+			if err := acexy.CloseStream(stream); err != nil {
+				slog.Debug("Failed to send stop command to engine",
+					"stream_id", streamID, "error", err)
+			}
+		}()
 	}
 }
 
@@ -337,9 +343,7 @@ func (p *Proxy) HandleStatus(w http.ResponseWriter, r *http.Request) {
 
 	// Return simple health check
 	w.Header().Set("Content-Type", "application/json")
-	_ = json.NewEncoder(w).Encode(map[string]any{
-		"status": "ok",
-	})
+	_, _ = w.Write(statusOKResponse)
 }
 
 func (s *Size) Set(value string) error {